@@ -4,24 +4,28 @@ import sys
 import stat
 import logging
 import fnmatch
-import difflib
 from datetime import date
 from shutil import copyfile
 
 import click
-import click_log
 
 from dulwich.repo import Repo
 from dulwich.errors import NotGitRepository
-from dulwich.porcelain import clone, open_repo_closing, commit, tag_create, tag_list
+
+try:
+    import re2  # Optional, from 'google-re2': linear time matching of many patterns in one scan
+except ImportError:
+    re2 = None
 
 from ._version import __version__
 
 logger = logging.getLogger(__name__)
-click_log.basic_config(logger)
 
 DEMISTO_CONTENT_URL = 'git@github.com:demisto/content.git'
 DEMISTO_CONTENT_DIR = os.path.join(os.getcwd(), 'demisto-content')
+EXTERNAL_DIFF_MIN_SIZE = 64 * 1024  # Files bigger than this are diffed by git (C) rather than difflib (pure python)
+DIFF_CHUNK_SIZE = 64  # Number of files diffed per process pool task
+DIFF_COLORS = {'-': 'red', '+': 'green'}  # Color of diff lines, by first character
 
 
 class IgnoredFiles(object):
@@ -37,8 +41,14 @@ class IgnoredFiles(object):
           :param bool use_default_ignores: Auto-add all usual ignores? (ie: .git/ .gradle/ etc)
         """
         self.root = os.path.abspath(path)
+        self._root_len = len(self.root) + 1  # Slicing paths with this yields path relative to self.root
         self.invalid = []
-        self._regexes = set()
+        # Patterns are partitioned when added, in ignore file order. When several patterns match a path, the one reported
+        # is the first found by _PatternBucket.match() lookup order (catch-all, suffix, exact, regex), not the first line
+        self._file_patterns = []  # Patterns applying to files and directories alike
+        self._dir_patterns = []  # Patterns applying to directories only (never tested against files)
+        self._any = None  # Compiled self._file_patterns, see _compile()
+        self._dir_only = None  # Compiled self._dir_patterns
         self.basename = basename
 
         self.parse_gitignore(os.path.join(os.path.dirname(self.root), basename))
@@ -46,10 +56,10 @@ class IgnoredFiles(object):
             self.add('.git/')
 
     def __repr__(self):
-        return '%s ignores, %s invalid' % (len(self._regexes), len(self.invalid))
+        return '%s ignores, %s invalid' % (len(self), len(self.invalid))
 
     def __len__(self):
-        return len(self._regexes)
+        return len(self._file_patterns) + len(self._dir_patterns)
 
     def match(self, path, is_dir=None):
         """
@@ -57,36 +67,66 @@ class IgnoredFiles(object):
           :param bool|None is_dir: If applicable, caller can indicate whether 'full_path' is a directory or not (to save a file stat call)
           :return IgnorePattern|None: Pattern that leads to 'path' being ignored, if any
         """
-        for regex in self._regexes:
-            if regex.match(path, is_dir=is_dir):
-                return regex
+        if self._any is None:
+            self._compile()
+
+        # Computed once here for all patterns (rsplit() is cheaper than os.path.basename())
+        basename = path.rsplit('/', 1)[-1]
+        relative_path = path[self._root_len:]
+
+        m = self._any.match(basename, relative_path)
+        if m or is_dir is False or not self._dir_patterns:
+            return m  # Files are never tested against directory-only patterns
+
+        m = self._dir_only.match(basename, relative_path)
+        if m and (is_dir or os.path.isdir(path)):
+            return m
 
         return None
 
+    def _compile(self):
+        """
+          Merge all patterns into a few lookup tables / combined regexes, so that matching a path doesn't cost one call per pattern
+        """
+        self._any = _PatternBucket(tuple(self._file_patterns))
+        self._dir_only = _PatternBucket(tuple(self._dir_patterns))
+
     def show_ignores(self):
         """
           Useful for debugging, show which files would be ignored in self.root, and why (due to which pattern)
         """
         result = []
 
-        for root, dirs, files in os.walk(self.root):
-            for basename in dirs[:]:
-                fpath = os.path.join(root, basename)
-                relative_path = fpath[len(self.root) + 1:]
-                m = self.match(fpath, is_dir=True)
-                if m:
-                    dirs.remove(basename)
-                    result.append("%-30s: %s" % (m.description, relative_path))
-
-            for basename in files:
-                fpath = os.path.join(root, basename)
-                relative_path = fpath[len(self.root) + 1:]
-                m = self.match(fpath, is_dir=False)
-                if m:
-                    result.append("%-30s: %s" % (m.description, relative_path))
+        for entry, is_dir, m in self.scan(self.root):
+            if m:
+                result.append("%-30s: %s" % (m.description, entry.path[self._root_len:]))
 
         return '\n'.join(result)
 
+    def scan(self, path):
+        """
+          Walk 'path' (like os.walk(), but via os.scandir() so that file types come for free), not descending into ignored folders
+          :param str path: Folder to walk
+          :return generator: (os.DirEntry, bool is_dir, IgnorePattern|None) for each file and folder, pattern is None when not ignored
+        """
+        match = self.match
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    entries = list(entries)
+
+            except OSError:
+                continue  # Same as os.walk(): silently skip unreadable folders
+
+            for entry in entries:
+                is_dir = entry.is_dir()
+                m = match(entry.path, is_dir=is_dir)
+                if is_dir and not m and not entry.is_symlink():
+                    stack.append(entry.path)
+
+                yield entry, is_dir, m
+
     def parse_gitignore(self, path):
         """
           Add ignores as defined in .gitignore file with 'path'
@@ -137,7 +177,155 @@ class IgnoredFiles(object):
             self.invalid.append(pat)
 
         else:
-            self._regexes.add(pat)
+            patterns = self._dir_patterns if pat.applies_to_directories else self._file_patterns
+            patterns.append(pat)
+            self._any = self._dir_only = None  # Recompiled lazily on next match()
+
+
+class _PatternBucket(object):
+    """
+      Several IgnorePattern-s, matched all at once: exact names and '*.ext' suffixes via dict lookup, globs via one combined regex
+    """
+
+    def __init__(self, patterns):
+        """
+          :param iterable patterns: IgnorePattern-s to merge
+        """
+        self.exact_basename = {}
+        self.exact_relative_path = {}
+        self.suffixes = {}
+        self.match_all = None  # Pattern matching anything, if any
+        basename_regexes = []
+        relative_path_regexes = []
+
+        for pat in patterns:
+            if pat.exact_match:
+                exact = self.exact_basename if pat.match_basename else self.exact_relative_path
+                exact.setdefault(pat.exact_match, pat)
+
+            elif pat.suffix:
+                self.suffixes.setdefault(pat.suffix, pat)
+
+            elif pat.match_all:
+                self.match_all = self.match_all or pat
+
+            else:
+                regexes = basename_regexes if pat.match_basename else relative_path_regexes
+                regexes.append(pat)
+
+        self.regex_basename = _RegexUnion(basename_regexes)
+        self.regex_relative_path = _RegexUnion(relative_path_regexes)
+
+    def match(self, basename, relative_path):
+        """
+          :param str basename: Basename of file or folder
+          :param str relative_path: Path of file or folder, relative to ignore file's folder
+          :return IgnorePattern|None: Pattern matching given names, if any
+        """
+        if self.match_all:
+            return self.match_all
+
+        if self.suffixes:
+            i = basename.rfind('.')
+            if i >= 0:
+                m = self.suffixes.get(basename[i:])
+                if m:
+                    return m
+
+        return (self.exact_basename.get(basename)
+                or self.exact_relative_path.get(relative_path)
+                or self.regex_basename.match(basename)
+                or self.regex_relative_path.match(relative_path))
+
+
+class _RegexUnion(object):
+    """
+      Regexes of several IgnorePattern-s combined into one alternation (one regex call instead of one per pattern)
+      When 'google-re2' is installed, patterns it supports are matched by an RE2 set instead (DFA, no backtracking)
+    """
+
+    def __init__(self, patterns):
+        """
+          :param list patterns: IgnorePattern-s having a 'regex'
+        """
+        self.re2_set = None
+        self.re2_patterns = []
+        if re2 is not None and patterns:
+            patterns = self._add_re2_patterns(patterns)
+
+        self.patterns = {}
+        alternatives = []
+        for i, pat in enumerate(patterns):
+            # Each alternative gets its own named group, 'lastgroup' then tells us which pattern matched
+            group = '_%s' % i
+            self.patterns[group] = pat
+            alternatives.append('(?P<%s>%s)' % (group, pat.regex.pattern))
+
+        self.regex = re.compile('|'.join(alternatives), re.ASCII) if alternatives else None
+
+    def _add_re2_patterns(self, patterns):
+        """
+          :param list patterns: IgnorePattern-s to add to RE2 set
+          :return list: Patterns RE2 can't handle (lookarounds, atomic groups...), to be matched via 're' instead
+        """
+        rejected = []
+        re2_set = re2.Set.FullMatchSet()
+        for pat in patterns:
+            regex = pat.regex.pattern
+            if '(?>' in regex or '(?=' in regex or '(?P' in regex:
+                # Atomic groups / lookaheads from fnmatch.translate(), not supported by RE2 (which would also log an error)
+                rejected.append(pat)
+                continue
+
+            if regex.endswith('\\Z'):
+                regex = regex[:-2] + '\\z'  # fnmatch.translate() ends patterns with \Z, RE2 spells it \z
+
+            try:
+                re2_set.Add(regex)
+                self.re2_patterns.append(pat)
+
+            except re2.error:
+                rejected.append(pat)
+
+        if self.re2_patterns:
+            re2_set.Compile()
+            self.re2_set = re2_set
+
+        return rejected
+
+    def _match_re2(self, name):
+        """
+          :param str name: Name to match
+          :return IgnorePattern|None: First RE2 handled pattern matching 'name', if any
+        """
+        try:
+            matches = self.re2_set.Match(name)
+
+        except UnicodeEncodeError:
+            # Undecodable file name (surrogate escapes), can't go through RE2: fallback to 're'
+            for pat in self.re2_patterns:
+                if pat.regex.fullmatch(name):
+                    return pat
+
+            return None
+
+        return matches and self.re2_patterns[min(matches)]
+
+    def match(self, name):
+        """
+          :param str name: Name to match
+          :return IgnorePattern|None: First pattern matching 'name', if any
+        """
+        if self.re2_set is not None:
+            m = self._match_re2(name)
+            if m:
+                return m
+
+        if self.regex is None:
+            return None
+
+        m = self.regex.fullmatch(name)
+        return m and self.patterns[m.lastgroup]
 
 
 class IgnorePattern(object):
@@ -159,7 +347,9 @@ class IgnorePattern(object):
         self.applies_to_directories = False  # When True, this pattern applies to directories only (not files or symlinks)
         self.match_basename = False  # When True, match against filename (otherwise: relative path)
         self.exact_match = None  # Exact string to match (no regex needed)
-        self.regex = None  # Regex to use
+        self.suffix = None  # Basename suffix to match, for simple '*.ext' patterns (no regex needed)
+        self.match_all = False  # When True, pattern matches any name (no regex needed)
+        self.regex = None  # Regex to use, must match whole name (see fullmatch())
 
         if pattern.endswith('/') and not pattern.endswith('*/'):
             # Anything ending with '/' simply means pattern applies to directories only
@@ -174,12 +364,12 @@ class IgnorePattern(object):
 
             if not pattern:
                 self.match_basename = True
-                self.regex = re.compile('.*')
+                self.match_all = True
 
             elif '/' in pattern:
-                # **/foo/bar
+                # **/foo/bar: at any depth (including top level), along with anything below it
                 self.match_basename = False
-                self.regex = re.compile('.*/%s' % re.escape(pattern))
+                self.regex = re.compile('(?:.+/)?%s(?:/.*)?' % re.escape(pattern))
 
             else:
                 # **/foo is the same as ignoring basename foo
@@ -198,7 +388,7 @@ class IgnorePattern(object):
 
             if not pattern:
                 self.match_basename = True
-                self.regex = re.compile('.*')
+                self.match_all = True
                 return
 
         if '/**/' in pattern:
@@ -207,8 +397,8 @@ class IgnorePattern(object):
                 self.invalid = "Too complex"
                 return
 
-            # Provide regex representing "foo/**/bar"
-            self.regex = re.compile('%s(/.*/|/)?%s' % (re.escape(first), re.escape(second)))
+            # Provide regex representing "foo/**/bar" (single optional '.+', no nested alternation to backtrack through)
+            self.regex = re.compile('%s(?:/.+)?/%s' % (re.escape(first), re.escape(second)))
             return
 
         if '**' in pattern:
@@ -223,9 +413,13 @@ class IgnorePattern(object):
         elif '/' not in pattern:
             self.match_basename = True
 
+        if self.match_basename and re.fullmatch(r'\*\.[A-Za-z0-9_]+', pattern):
+            self.suffix = pattern[1:]
+            return
+
         if self._has_glob(pattern):
             pattern = fnmatch.translate(pattern)
-            self.regex = re.compile(pattern)
+            self.regex = re.compile(pattern, re.ASCII)  # Translated globs have no \w, \b etc, ASCII is safe (and cheaper)
             return
 
         self.exact_match = pattern
@@ -245,26 +439,36 @@ class IgnorePattern(object):
           :param bool|None is_dir: If applicable, caller can indicate wether 'full_path' is a directory or not (to save a file stat call)
           :return bool: True if 'full_path' is an ignore-match by this pattern, False otherwise
         """
-        assert not self.invalid
+        if self.applies_to_directories and is_dir is None:
+            is_dir = os.path.isdir(full_path)
 
-        if self.applies_to_directories:
-            if is_dir is None:
-                is_dir = os.path.isdir(full_path)
+        return self._match_precomputed(full_path.rsplit('/', 1)[-1], full_path[len(self.root) + 1:], is_dir)
 
-            if not is_dir:
-                return False
+    def _match_precomputed(self, basename, relative_path, is_dir):
+        """
+          :param str basename: Basename of file or folder
+          :param str relative_path: Path of file or folder, relative to self.root
+          :param bool|None is_dir: Whether file is a directory (must be known for directory-only patterns)
+          :return bool: True if file or folder is an ignore-match by this pattern, False otherwise
+        """
+        assert not self.invalid
 
-        if self.match_basename:
-            name = os.path.basename(full_path)
+        if self.applies_to_directories and not is_dir:
+            return False
 
-        else:
-            name = full_path[len(self.root) + 1:]
+        name = basename if self.match_basename else relative_path
 
         if self.exact_match:
             return name == self.exact_match
 
+        if self.suffix:
+            return name.endswith(self.suffix)
+
+        if self.match_all:
+            return True
+
         assert self.regex
-        return self.regex.match(name)
+        return self.regex.fullmatch(name)
 
 
 def get_filesystem_encoding():
@@ -310,26 +514,26 @@ class RepoParamType(click.ParamType):
 
 def list_files(mypath):
     """Lists all files in given path ignoring files specified by .contentignore"""
-    all_files = []
     ignored_files = IgnoredFiles(mypath)
-    for root, dirs, files in os.walk(mypath):
-        ignored_files.remove_ignored_folders(root, dirs)
-
-        for filename in files:
-            fpath = os.path.join(root, filename)
-            if ignored_files.match(fpath, is_dir=False):
-                continue
-            else:
-                all_files.append(fpath.replace(mypath + '/', ''))
-    return all_files
+    prefix_len = len(mypath) + 1  # Entry paths all start with mypath + '/'
+    return [entry.path[prefix_len:] for entry, is_dir, m in ignored_files.scan(mypath) if not is_dir and not m]
 
 
 def add(content_repo, custom_content_repo, paths):
     """Add files to the custom content repo and stage them."""
+    from dulwich.porcelain import open_repo_closing
+
+    content_prefix = content_repo.path + os.sep
+    custom_prefix = custom_content_repo.path + os.sep
+    created_dirs = set()  # Avoid a makedirs() (and its stat calls) for every file of a same folder
     for p in paths:
-        dst = os.path.join(custom_content_repo.path, p)
-        src = os.path.join(content_repo.path, p)
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        dst = custom_prefix + p
+        src = content_prefix + p
+        dst_dir = os.path.dirname(dst)
+        if dst_dir not in created_dirs:
+            os.makedirs(dst_dir, exist_ok=True)
+            created_dirs.add(dst_dir)
+
         copyfile(src, dst)
 
     with open_repo_closing(custom_content_repo) as r:
@@ -338,6 +542,8 @@ def add(content_repo, custom_content_repo, paths):
 
 def update_content():
     """Fetches the latest changes from `demisto-content`"""
+    from dulwich.porcelain import clone
+
     try:
         clone(DEMISTO_CONTENT_URL, DEMISTO_CONTENT_DIR)
     except FileExistsError as e:
@@ -348,33 +554,135 @@ def update_content():
 
 def determine_version(repo):
     """Determines the correct next version"""
-    tags = [x.decode('utf-8') for x in tag_list(repo)]
-    tags.sort(key=lambda s: [int(u) for u in s.split('.')])
+    from dulwich.porcelain import tag_list
+
+    versions = [tuple(int(u) for u in x.decode('utf-8').split('.')) for x in tag_list(repo)]
 
     today = date.today()
-    this_year = str(today.year)[2:]  # ignore the millennium
+    this_year = int(str(today.year)[2:])  # ignore the millennium
 
     index = 0
-    if tags:
-        year, month, index = tags[-1].split('.')
+    if versions:
+        year, month, index = max(versions)
         if year == this_year:
-            if month == str(today.month):
-                index = int(index) + 1
+            if month == today.month:
+                index = index + 1
+
+    return f'{this_year:02}.{today.month}.{index}'
+
+
+def file_digest(path):
+    """Hashes the contents of a file (BLAKE2b), without loading it whole in memory."""
+    import hashlib
+
+    with open(path, 'rb') as fh:
+        if hasattr(hashlib, 'file_digest'):  # python 3.11+, hashes in C
+            return hashlib.file_digest(fh, 'blake2b').digest()
+
+        h = hashlib.blake2b()
+        for chunk in iter(lambda: fh.read(64 * 1024), b''):
+            h.update(chunk)
+        return h.digest()
+
+
+def split_lines(text):
+    """Splits text on '\n' only (unlike str.splitlines()), keeping line endings, same as iterating over a file."""
+    lines = [line + '\n' for line in text.split('\n')]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+
+    return lines
+
+
+def external_diff(a, b):
+    """Creates a unified diff between two files using `git diff`, returns None if git can't be used."""
+    import subprocess
+
+    # Pin every setting (user/repo config, .gitattributes) that could change the output format. Note that git (myers)
+    # and difflib (SequenceMatcher) may still pick different hunks: output has difflib's format, not its exact content
+    args = [
+        'git', '-c', 'core.quotePath=false', '-c', 'diff.suppressBlankEmpty=false',
+        'diff', '--no-index', '--no-color', '--no-ext-diff', '--no-textconv', '--no-indent-heuristic',
+        '--diff-algorithm=myers', '--inter-hunk-context=0', '-U3', '--src-prefix=a/', '--dst-prefix=b/',
+        '--', a, b,
+    ]
+    try:
+        p = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
+        return None
+
+    if p.returncode not in (0, 1):
+        return None
+
+    lines = split_lines(p.stdout.decode('utf-8', 'ignore'))
+
+    # Skip git's own header ('diff --git', 'index' ...) and file names, to keep difflib's format
+    for i, line in enumerate(lines):
+        if line.startswith('--- '):
+            break
+    else:
+        return None  # Binary files or such, no usable diff
 
-    return f'{this_year}.{today.month}.{index}'
+    diff = ['--- \n', '+++ \n']
+    for line in lines[i + 2:]:
+        if line.startswith('@@ '):
+            # Drop function context git appends to hunk headers ('@@ -1,3 +1,3 @@ def foo():')
+            end = line.find(' @@', 2)
+            if end > 0:
+                line = line[:end + 3] + '\n'
+
+        elif line.startswith('\\'):
+            # '\ No newline at end of file': difflib rather leaves the previous line without its newline
+            diff[-1] = diff[-1].rstrip('\n')
+            continue
+
+        diff.append(line)
+
+    return diff
+
+
+def read_lines(path):
+    """Reads and decodes lines of a file."""
+    with open(path, 'rb') as fh:
+        return split_lines(fh.read().decode('utf-8', 'ignore'))
 
 
 def calculate_diff(a, b):
     """Creates a unified diff between two files."""
-    with open(a, 'rb') as cp:
-        with open(b, 'rb') as cc:
-            src_lines = [x.decode('utf-8', 'ignore') for x in list(cp)]
-            dst_lines = [x.decode('utf-8', 'ignore') for x in list(cc)]
-            return list(difflib.unified_diff(src_lines, dst_lines))
+    import difflib
+
+    a_stat = os.stat(a)
+    b_stat = os.stat(b)
+    if a_stat.st_size == b_stat.st_size and file_digest(a) == file_digest(b):
+        return []
+
+    if max(a_stat.st_size, b_stat.st_size) > EXTERNAL_DIFF_MIN_SIZE:
+        diff = external_diff(a, b)
+        if diff is not None:
+            return diff
+
+    src_lines = read_lines(a)
+    dst_lines = read_lines(b)
+
+    return list(difflib.unified_diff(src_lines, dst_lines))
+
+
+def calculate_diff_pair(paths):
+    """Diffs a (partial_path, content_path, custom_path) triple, returns (partial_path, diff) (for use in a process pool)."""
+    partial_path, content_path, custom_path = paths
+    return partial_path, calculate_diff(content_path, custom_path)
+
+
+def calculate_diff_pairs(chunk):
+    """Diffs a list of triples (see calculate_diff_pair()), to be submitted to a process pool as one task."""
+    return [calculate_diff_pair(paths) for paths in chunk]
 
 
 def create_release(custom_content_repo):
     """Creates a new release by committing and tagging changes."""
+    from dulwich.porcelain import commit, tag_create
+
     version = determine_version(custom_content_repo)
     commit(custom_content_repo, b'Demisto custom content sync.')
     tag_create(custom_content_repo, version, message=b'Automatic release based on demisto-content update.')
@@ -391,58 +699,83 @@ def confirm(msg, force=None, default=False):
 
 def sync(custom_content_repo, force=None):
     """Syncs content between `demisto-content` and a custom repository."""
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
     click.secho('Ensuring that demisto content is up to date... ', nl=False)
     content_repo = update_content()
     click.secho('Done!', fg='green')
 
     click.secho('Filtering ignored files... ', nl=False)
-    content_files = list_files(content_repo.path)
-    custom_content_files = list_files(custom_content_repo.path)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Both walks are mostly I/O (GIL released in syscalls), run them concurrently
+        content_files = executor.submit(list_files, content_repo.path)
+        custom_content_files = executor.submit(list_files, custom_content_repo.path)
+        content_files = content_files.result()
+        custom_content_files = set(custom_content_files.result())
     click.secho('Done!', fg='green')
 
+    # Partial paths are relative, plain concatenation is enough (and cheaper than os.path.join() per file)
+    content_prefix = content_repo.path + os.sep
+    custom_prefix = custom_content_repo.path + os.sep
+    present_files = [
+        (p, content_prefix + p, custom_prefix + p)
+        for p in content_files if p in custom_content_files
+    ]
+
     add_all = False
     modify_all = False
     staged_files = []
-    for partial_path in content_files:
-        if partial_path not in custom_content_files:
-            click.secho(f'{partial_path} ', nl=False)
-            click.secho('New!', fg='green')
-
-            if add_all:
-                staged_files.append(partial_path)
-                continue
-
-            if confirm('Do you want to add this file?', force=force, default=True):
-                staged_files.append(partial_path)
-                if confirm('Do you want to add all new files?', force=force):
-                    add_all = True
-        else:
-            content_path = os.path.join(content_repo.path, partial_path)
-            custom_path = os.path.join(custom_content_repo.path, partial_path)
-
-            diff = calculate_diff(content_path, custom_path)
-
-            if diff:
+    executor = ProcessPoolExecutor()  # Default worker count (os.cpu_count(), capped on Windows)
+    futures = []
+    try:
+        # Diffs are computed in parallel (in chunks, to limit inter-process overhead),
+        # but consumed in order since prompts are sequential
+        for i in range(0, len(present_files), DIFF_CHUNK_SIZE):
+            futures.append(executor.submit(calculate_diff_pairs, present_files[i:i + DIFF_CHUNK_SIZE]))
+        diffs = (result for future in futures for result in future.result())
+
+        for partial_path in content_files:
+            if partial_path not in custom_content_files:
                 click.secho(f'{partial_path} ', nl=False)
-                click.secho('Modified!', fg='yellow')
+                click.secho('New!', fg='green')
 
-                if modify_all:
+                if add_all:
                     staged_files.append(partial_path)
                     continue
 
-                if confirm('Do you want to view diff?', force=force):
-                    for d in diff:
-                        if d.startswith('-'):
-                            click.secho(d, fg='red', nl=False)
-                        elif d.startswith('+'):
-                            click.secho(d, fg='green', nl=False)
-                        else:
-                            click.echo(d, nl=False)
-
-                if confirm('Do you want to accept these changes?', force=force, default=True):
+                if confirm('Do you want to add this file?', force=force, default=True):
                     staged_files.append(partial_path)
-                    if confirm('Do you want to add all modified files?', force=force):
+                    if confirm('Do you want to add all new files?', force=force):
                         add_all = True
+            else:
+                _, diff = next(diffs)
+
+                if diff:
+                    click.secho(f'{partial_path} ', nl=False)
+                    click.secho('Modified!', fg='yellow')
+
+                    if modify_all:
+                        staged_files.append(partial_path)
+                        continue
+
+                    if confirm('Do you want to view diff?', force=force):
+                        for d in diff:
+                            color = DIFF_COLORS.get(d[:1])
+                            if color:
+                                click.secho(d, fg=color, nl=False)
+                            else:
+                                click.echo(d, nl=False)
+
+                    if confirm('Do you want to accept these changes?', force=force, default=True):
+                        staged_files.append(partial_path)
+                        if confirm('Do you want to add all modified files?', force=force):
+                            add_all = True
+
+    finally:
+        # Don't wait for remaining diffs if user aborted a prompt
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
 
     add(content_repo, custom_content_repo, staged_files)
 
@@ -458,10 +791,16 @@ def sync(custom_content_repo, force=None):
     click.secho('Content sync complete.', fg='green')
 
 
+def _configure_logging():
+    """Sets up click-aware logging, deferred so that `--help`/`--version` don't pay for the import."""
+    import click_log
+    click_log.basic_config(logger)
+
+
 @click.group()
 @click.version_option(version=__version__)
 def integrator_cli():
-    pass
+    _configure_logging()
 
 
 @integrator_cli.command(name='sync', help=sync.__doc__)
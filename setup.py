@@ -46,6 +46,9 @@ setup(
         'click-log>=0.2.1',
         'dulwich>=0.19.2'
     ],
+    extras_require={
+        're2': ['google-re2']
+    },
     entry_points={
       'console_scripts': [
           'integrator = demisto_integrator.cli:entry_point'